@@ -1,15 +1,21 @@
 from functools import wraps
 import cProfile
 import inspect
-import time
+import os
+from time import perf_counter_ns
+
+# Set FORGEKIT_PROFILE=0 to make every decorator return the function unwrapped
+_ENABLED = os.environ.get("FORGEKIT_PROFILE", "1") != "0"
 
 
 def argtype(func):
     """Shows the type of passed arguments for the given function."""
+    if not _ENABLED:
+        return func
+    arg_names = tuple(inspect.getfullargspec(func).args)
 
     @wraps(func)
     def wrapper(*args, **kwargs):
-        arg_names = inspect.getfullargspec(func).args
         arg_types = [f"{name}: {type(arg)}" if arg is not None else 'None' for name, arg in zip(arg_names, args)]
         kwarg_types = [f"{key}: {type(value).__name__}" if value is not None else f"{key}: None" for key, value in kwargs.items()]
         print(f"Calling {func.__name__} with arguments:\n {arg_types}")
@@ -21,10 +27,14 @@ def argtype(func):
 
 def cputime(f):
     """Display CPU Time statistics of given function."""
+    if not _ENABLED:
+        return f
+
+    _scope = _get_scope(f)
 
     @wraps(f)
     def wrapper(*args, **kwargs):
-        print(f'CPU runtime for {_get_scope(f, args)}:')
+        print(f'CPU runtime for {_scope}:')
 
         t = cProfile.Profile()
         r = t.runcall(f, *args, **kwargs)
@@ -36,11 +46,16 @@ def cputime(f):
 
 def docs(f):
     """Display Docstrings of given function."""
+    if not _ENABLED:
+        return f
+
+    _scope = _get_scope(f)
+    _doc = inspect.getdoc(f)
 
     @wraps(f)
     def wrapper(*args, **kwargs):
-        print(f'Documentation for {_get_scope(f, args)}:')
-        print(inspect.getdoc(f))
+        print(f'Documentation for {_scope}:')
+        print(_doc)
 
         return f(*args, **kwargs)
 
@@ -48,15 +63,19 @@ def docs(f):
 
 def timeit(f):
     """Display Runtime statistics of given function."""
+    if not _ENABLED:
+        return f
+
+    _scope = _get_scope(f)
 
     @wraps(f)
     def wrapper(*args, **kwargs):
-        print(f'Execution speed of {_get_scope(f, args)}:')
-        _t0 = time.time()
+        print(f'Execution speed of {_scope}:')
+        _t0 = perf_counter_ns()
         _runtime = f(*args, **kwargs)
-        _t1 = time.time()
+        _t1 = perf_counter_ns()
 
-        print(f'took {_t1 - _t0:.3f} seconds.')
+        print(f'took {(_t1 - _t0) / 1e9:.3f} seconds.')
 
         return _runtime
 
@@ -64,11 +83,13 @@ def timeit(f):
 
 def trace(f):
     """Display epic argument and context call information of given function."""
+    if not _ENABLED:
+        return f
+
+    _scope = _get_scope(f)
 
     @wraps(f)
     def wrapper(*args, **kwargs):
-        _scope = _get_scope(f, args)
-
         print(f'Calling {_scope} with:')
         print(f'   args: {args}')
         print(f'   kwargs: {kwargs}')
@@ -77,17 +98,7 @@ def trace(f):
 
     return wrapper
 
-def _get_scope(f, args):
+def _get_scope(f):
     """Get scope name of the given function."""
 
-    _scope = inspect.getmodule(f).__name__
-    try:
-        if f.__name__ in dir(args[0].__class__):
-            _scope += '.' + args[0].__class__.__name__
-            _scope += '.' + f.__name__
-        else:
-            _scope += '.' + f.__name__
-    except IndexError:
-        _scope += '.' + f.__name__
-
-    return _scope
+    return f"{getattr(f, '__module__', None) or '<unknown>'}.{f.__qualname__}"
@@ -1,25 +1,51 @@
-from pyfiglet import Figlet, FigletFont
+from functools import lru_cache
 from rich.console import Console
 from src.configs.config import Config
 from pathlib import Path
 
 console = Console()
 
-def Logo(version, author):
-    font_path = Path(Config.FONT_DIR)
+BANNER_TITLE = 'TickerTricker'
+# Pre-rendered output of the Figlet font engine; regenerate with `python banner.py`
+BANNER_TEXT_PATH = Path(__file__).with_name('banner.txt')
+
+def _load_banner_text():
+    """Read the pre-rendered banner, or return None so it is rendered on demand."""
+    try:
+        return BANNER_TEXT_PATH.read_text(encoding='utf-8')
+    except OSError:
+        return None
+
+_BANNER_TEXT = _load_banner_text()
+
+@lru_cache(maxsize=None)
+def _get_figlet():
+    """Build the banner Figlet once, installing the bundled font on first use."""
+    # pyfiglet is only needed when a banner is actually shown
+    from pyfiglet import Figlet, FigletFont, FontNotFound
+
     font_name = '3d'
     try:
-        if font_name not in FigletFont.getFonts():
-            custom_font = font_path / f"{font_name}.flf"
-            if not custom_font.is_file():
-                raise FileNotFoundError(f"Font file '{custom_font}' not found.")
-            FigletFont.installFonts(str(custom_font))
-
-        f = Figlet(font=font_name, width=120, justify='left')
-        console.print(f"[bold blue]{f.renderText('TickerTricker')}[/bold blue]")
+        return Figlet(font=font_name, width=120, justify='left')
+    except FontNotFound:
+        custom_font = Path(Config.FONT_DIR) / f"{font_name}.flf"
+        if not custom_font.is_file():
+            raise FileNotFoundError(f"Font file '{custom_font}' not found.")
+        FigletFont.installFonts(str(custom_font))
+        return Figlet(font=font_name, width=120, justify='left')
+
+def Logo(version, author):
+    try:
+        banner = _BANNER_TEXT
+        if banner is None:
+            banner = _get_figlet().renderText(BANNER_TITLE)
+        console.print(f"[bold blue]{banner}[/bold blue]")
         console.print(f"[bold blue]AUTHOR: {author}[/bold blue]")
         console.print(f"[bold blue]VERSION: {version}[/bold blue]\n")
 
     except Exception as e:
         console.print(f"[bold red]Error loading font: {e}[/bold red]")
 
+if __name__ == "__main__":
+    BANNER_TEXT_PATH.write_text(_get_figlet().renderText(BANNER_TITLE), encoding='utf-8')
+    print(f"Wrote {BANNER_TEXT_PATH}")
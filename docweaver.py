@@ -8,8 +8,7 @@ Usage:
 
 import ast
 import argparse
-from typing import Optional, List, Tuple
-from garnishv2 import timeit
+from typing import Optional, List, Tuple, Union
 
 
 def ast_to_source(node: ast.AST) -> str:
@@ -22,7 +21,9 @@ def ast_to_source(node: ast.AST) -> str:
     except Exception:
         return repr(node)
 
-def extract_parameters(func: ast.FunctionDef) -> List[Tuple[str, Optional[str]]]:
+def extract_parameters(
+    func: Union[ast.FunctionDef, ast.AsyncFunctionDef]
+) -> List[Tuple[str, Optional[str]]]:
     """
     Extract parameter names and type annotations (if present) from a function.
 
@@ -59,7 +60,9 @@ def extract_parameters(func: ast.FunctionDef) -> List[Tuple[str, Optional[str]]]
 
     return params
 
-def generate_function_docstring(func: ast.FunctionDef, parent_class: Optional[str] = None) -> str:
+def generate_function_docstring(
+    func: Union[ast.FunctionDef, ast.AsyncFunctionDef], parent_class: Optional[str] = None
+) -> str:
     """
     Generate a professional-looking Google-style docstring skeleton for a function or method.
     """
@@ -133,11 +136,13 @@ class DocstringInjector(ast.NodeTransformer):
 
     def __init__(self):
         super().__init__()
-        self.class_stack: List[str] = []
+        # Innermost enclosing class, so we know whether functions are methods
+        self._current_class: Optional[str] = None
 
     def visit_ClassDef(self, node: ast.ClassDef):
-        # Track current class name so we know whether functions are methods
-        self.class_stack.append(node.name)
+        # The enclosing class is kept on the call stack and restored on the way out
+        outer_class = self._current_class
+        self._current_class = node.name
 
         # Add class docstring if missing
         if ast.get_docstring(node) is None and node.body:
@@ -147,14 +152,12 @@ class DocstringInjector(ast.NodeTransformer):
 
         # Process methods inside the class
         self.generic_visit(node)
-        self.class_stack.pop()
+        self._current_class = outer_class
         return node
 
     def visit_FunctionDef(self, node: ast.FunctionDef):
-        parent_class = self.class_stack[-1] if self.class_stack else None
-
         if ast.get_docstring(node) is None and node.body:
-            docstring = generate_function_docstring(node, parent_class=parent_class)
+            docstring = generate_function_docstring(node, parent_class=self._current_class)
             expr = ast.Expr(value=ast.Constant(value=docstring))
             node.body.insert(0, expr)
 
@@ -162,10 +165,8 @@ class DocstringInjector(ast.NodeTransformer):
         return node
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        parent_class = self.class_stack[-1] if self.class_stack else None
-
         if ast.get_docstring(node) is None and node.body:
-            docstring = generate_function_docstring(node, parent_class=parent_class)
+            docstring = generate_function_docstring(node, parent_class=self._current_class)
             expr = ast.Expr(value=ast.Constant(value=docstring))
             node.body.insert(0, expr)
 
@@ -173,6 +174,41 @@ class DocstringInjector(ast.NodeTransformer):
         return node
 
 
+def inject_docstrings(tree: ast.AST) -> ast.AST:
+    """
+    Inject docstring skeletons into classes, functions and async functions
+    of the tree that do not already have one.
+
+    Walks the tree iteratively with an explicit stack that carries the name of
+    the enclosing class alongside each node, avoiding the per-node visitor
+    dispatch of DocstringInjector.
+    """
+    stack: List[Tuple[ast.AST, Optional[str]]] = [(tree, None)]
+    while stack:
+        node, parent_class = stack.pop()
+
+        if isinstance(node, ast.ClassDef):
+            if ast.get_docstring(node) is None and node.body:
+                _insert_docstring(node, generate_class_docstring(node))
+            parent_class = node.name
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if ast.get_docstring(node) is None and node.body:
+                _insert_docstring(
+                    node, generate_function_docstring(node, parent_class=parent_class)
+                )
+
+        stack.extend((child, parent_class) for child in ast.iter_child_nodes(node))
+
+    return tree
+
+
+def _insert_docstring(node: ast.AST, docstring: str) -> None:
+    """
+    Prepend a docstring expression to the body of a class or function node.
+    """
+    node.body.insert(0, ast.Expr(value=ast.Constant(value=docstring)))  # type: ignore[attr-defined]
+
+
 def process_file(input_path: str, output_path: str) -> None:
     """
     Read a Python file, inject docstring skeletons where missing, and
@@ -182,8 +218,7 @@ def process_file(input_path: str, output_path: str) -> None:
         source = f.read()
 
     tree = ast.parse(source)
-    transformer = DocstringInjector()
-    new_tree = transformer.visit(tree)
+    new_tree = inject_docstrings(tree)
     ast.fix_missing_locations(new_tree)
 
     try:
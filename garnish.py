@@ -2,212 +2,314 @@ from functools import wraps
 import cProfile
 import pstats
 import inspect
+import os
 import time
+from time import perf_counter_ns
 import logging
-from typing import Callable, Any, Optional
+from typing import Callable, Any, Iterable, Optional
 from io import StringIO
 
 
 logger = logging.getLogger(__name__)
 
+# Set FORGEKIT_PROFILE=0 to make every decorator return the function unwrapped
+_ENABLED = os.environ.get("FORGEKIT_PROFILE", "1") != "0"
+
+_SEP = "=" * 60
+
 
 def argtype(func: Callable) -> Callable:
     """Shows the type of passed arguments for the given function."""
+    if not _ENABLED:
+        return func
+    # Introspect once per decorated function rather than on every call
+    arg_names = tuple(inspect.getfullargspec(func).args)
+    prefix = f"Calling {func.__name__} with arguments:\n  "
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        arg_names = inspect.getfullargspec(func).args
-        arg_types = [f"{name}: {type(arg).__name__}" for name, arg in zip(arg_names, args)]
-        kwarg_types = [f"{key}: {type(value).__name__}" for key, value in kwargs.items()]
+        output = f"{prefix}[{_format_arg_types(arg_names, args)}]"
+        if kwargs:
+            kwarg_types = _format_arg_types(kwargs.keys(), kwargs.values())
+            output += f'\n  keyword-arguments: [{kwarg_types}]'
         
-        output = f"Calling {func.__name__} with arguments:\n  {arg_types}"
-        if kwarg_types:
-            output += f'\n  keyword-arguments: {kwarg_types}'
-        
-        logger.info(output)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(output)
         print(output)
         return func(*args, **kwargs)
     return wrapper
 
 
-def cputime(func: Callable, sort_by: str = 'cumulative', limit: int = 20) -> Callable:
+def cputime(func: Optional[Callable] = None,
+            *,
+            sort_by: str = 'cumulative',
+            limit: int = 20,
+            backend: str = 'deterministic',
+            interval: float = 0.001) -> Callable:
     """
     Display CPU time statistics of given function.
     
+    Usable bare (``@cputime``) or with options (``@cputime(sort_by='time')``).
+    
     Args:
-        func: Function to profile
+        func: Function to profile (supplied automatically when used bare)
         sort_by: Sort key for statistics ('cumulative', 'time', 'calls', etc.)
         limit: Number of lines to display in profile output
+        backend: 'deterministic' (cProfile) or 'sampling' (pyinstrument, falls
+            back to cProfile when pyinstrument is not installed)
+        interval: Sampling interval in seconds for the 'sampling' backend
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        scope = _get_scope(func, args)
-        print(f'CPU runtime for {scope}:')
-        
-        profiler = cProfile.Profile()
-        result = profiler.runcall(func, *args, **kwargs)
-        
-        # Redirect profile output to string buffer for better control
-        string_buffer = StringIO()
-        stats = pstats.Stats(profiler, stream=string_buffer)
-        stats.sort_stats(sort_by)
-        stats.print_stats(limit)
-        
-        print(string_buffer.getvalue())
-        return result
-    return wrapper
+    def decorator(func: Callable) -> Callable:
+        if not _ENABLED:
+            return func
+        sampler = _sampling_profiler_class(backend)
+        scope = _get_scope(func)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            print(f'CPU runtime for {scope}:')
+            
+            if sampler is not None:
+                profiler = sampler(interval=interval)
+                profiler.start()
+                try:
+                    result = func(*args, **kwargs)
+                finally:
+                    profiler.stop()
+                print(profiler.output_text(unicode=True, color=False))
+                return result
+            
+            profiler = cProfile.Profile()
+            result = profiler.runcall(func, *args, **kwargs)
+            
+            # Redirect profile output to string buffer for better control
+            string_buffer = StringIO()
+            stats = pstats.Stats(profiler, stream=string_buffer)
+            stats.sort_stats(sort_by)
+            stats.print_stats(limit)
+            
+            print(string_buffer.getvalue())
+            return result
+        return wrapper
+    return _decorate(decorator, func)
 
 
 def docs(func: Callable) -> Callable:
     """Display docstrings of given function."""
+    if not _ENABLED:
+        return func
+
+    # A function's docstring doesn't change, so clean it up only once
+    header = f'Documentation for {_get_scope(func)}:'
+    doc = inspect.getdoc(func) or "No documentation available."
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        scope = _get_scope(func, args)
-        print(f'Documentation for {scope}:')
-        doc = inspect.getdoc(func)
-        if doc:
-            print(doc)
-        else:
-            print("No documentation available.")
+        print(header)
+        print(doc)
         return func(*args, **kwargs)
     return wrapper
 
 
-def timeit(func: Callable, precision: int = 3) -> Callable:
+def timeit(func: Optional[Callable] = None, *, precision: int = 3) -> Callable:
     """
     Display runtime statistics of given function.
     
+    Usable bare (``@timeit``) or with options (``@timeit(precision=5)``).
+    
     Args:
-        func: Function to time
+        func: Function to time (supplied automatically when used bare)
         precision: Decimal places for time display
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        scope = _get_scope(func, args)
-        print(f'Execution speed of {scope}:')
-        
-        start_time = time.perf_counter()
-        result = func(*args, **kwargs)
-        end_time = time.perf_counter()
-        
-        elapsed = end_time - start_time
-        print(f'took {elapsed:.{precision}f} seconds.')
-        
-        logger.info(f'{scope} took {elapsed:.{precision}f} seconds')
-        return result
-    return wrapper
+    def decorator(func: Callable) -> Callable:
+        if not _ENABLED:
+            return func
+
+        scope = _get_scope(func)
+        fmt = f'took {{:.{precision}f}} seconds.'
 
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            print(f'Execution speed of {scope}:')
+            
+            start_time = perf_counter_ns()
+            result = func(*args, **kwargs)
+            end_time = perf_counter_ns()
+            
+            elapsed = (end_time - start_time) / 1e9
+            print(fmt.format(elapsed))
+            
+            if logger.isEnabledFor(logging.INFO):
+                logger.info('%s took %.*f seconds', scope, precision, elapsed)
+            return result
+        return wrapper
+    return _decorate(decorator, func)
 
-def trace(func: Callable, verbose: bool = True) -> Callable:
+
+def trace(func: Optional[Callable] = None, *, verbose: bool = True) -> Callable:
     """
     Display argument and context call information of given function.
     
+    Usable bare (``@trace``) or with options (``@trace(verbose=False)``).
+    
     Args:
-        func: Function to trace
+        func: Function to trace (supplied automatically when used bare)
         verbose: If True, show full argument details; if False, show summary
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        scope = _get_scope(func, args)
-        
-        if verbose:
-            print(f'Calling {scope} with:')
-            print(f'   args: {args}')
-            print(f'   kwargs: {kwargs}')
-        else:
-            print(f'Calling {scope} with {len(args)} args and {len(kwargs)} kwargs')
-        
-        logger.debug(f'Trace: {scope}(args={args}, kwargs={kwargs})')
-        return func(*args, **kwargs)
-    return wrapper
+    def decorator(func: Callable) -> Callable:
+        if not _ENABLED:
+            return func
+
+        scope = _get_scope(func)
 
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if verbose:
+                print(f'Calling {scope} with:')
+                print(f'   args: {args}')
+                print(f'   kwargs: {kwargs}')
+            else:
+                print(f'Calling {scope} with {len(args)} args and {len(kwargs)} kwargs')
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug('Trace: %s(args=%s, kwargs=%s)', scope, args, kwargs)
+            return func(*args, **kwargs)
+        return wrapper
+    return _decorate(decorator, func)
 
-def profile_all(func: Callable, 
+
+def profile_all(func: Optional[Callable] = None,
+                *,
                 show_args: bool = True,
                 show_time: bool = True,
                 show_cpu: bool = False) -> Callable:
     """
     Comprehensive profiling decorator combining multiple utilities.
     
+    Usable bare (``@profile_all``) or with options (``@profile_all(show_cpu=True)``).
+    
     Args:
-        func: Function to profile
+        func: Function to profile (supplied automatically when used bare)
         show_args: Display argument types
         show_time: Display execution time
         show_cpu: Display CPU profiling statistics
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        scope = _get_scope(func, args)
-        
-        if show_args:
-            arg_names = inspect.getfullargspec(func).args
-            arg_types = [f"{name}: {type(arg).__name__}" for name, arg in zip(arg_names, args)]
-            print(f'\n{"="*60}')
-            print(f'Profiling {scope}')
-            print(f'Arguments: {arg_types}')
-            if kwargs:
-                print(f'Keyword arguments: {list(kwargs.keys())}')
-        
-        if show_cpu:
-            profiler = cProfile.Profile()
-            profiler.enable()
-        
-        if show_time:
-            start_time = time.perf_counter()
-        
-        result = func(*args, **kwargs)
-        
-        if show_time:
-            elapsed = time.perf_counter() - start_time
-            print(f'Execution time: {elapsed:.3f} seconds')
-        
-        if show_cpu:
-            profiler.disable()
-            string_buffer = StringIO()
-            stats = pstats.Stats(profiler, stream=string_buffer)
-            stats.sort_stats('cumulative')
-            stats.print_stats(10)
-            print('\nCPU Profile (top 10):')
-            print(string_buffer.getvalue())
+    def decorator(func: Callable) -> Callable:
+        if not _ENABLED:
+            return func
+        arg_names = tuple(inspect.getfullargspec(func).args)
+        header = f'\n{_SEP}\nProfiling {_get_scope(func)}'
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if show_args:
+                print(header)
+                print(f'Arguments: [{_format_arg_types(arg_names, args)}]')
+                if kwargs:
+                    print(f'Keyword arguments: {list(kwargs.keys())}')
+            
+            if show_cpu:
+                profiler = cProfile.Profile()
+                profiler.enable()
+            
+            if show_time:
+                start_time = perf_counter_ns()
+            
+            result = func(*args, **kwargs)
+            
+            if show_time:
+                elapsed = (perf_counter_ns() - start_time) / 1e9
+                print(f'Execution time: {elapsed:.3f} seconds')
+            
+            if show_cpu:
+                profiler.disable()
+                string_buffer = StringIO()
+                stats = pstats.Stats(profiler, stream=string_buffer)
+                stats.sort_stats('cumulative')
+                stats.print_stats(10)
+                print('\nCPU Profile (top 10):')
+                print(string_buffer.getvalue())
+            
+            if show_args or show_time or show_cpu:
+                print(f'{_SEP}\n')
+            
+            return result
+        return wrapper
+    return _decorate(decorator, func)
+
+
+def _decorate(decorator: Callable[[Callable], Callable], func: Optional[Callable]) -> Callable:
+    """
+    Apply a configurable decorator, supporting both bare and called usage.
+    
+    Args:
+        decorator: Decorator already bound to its options
+        func: Function being decorated, or None when options were supplied
         
-        if show_args or show_time or show_cpu:
-            print(f'{"="*60}\n')
+    Returns:
+        The wrapped function for bare usage, otherwise the decorator itself
+    """
+    if func is None:
+        return decorator
+    if not callable(func):
+        raise TypeError(
+            f"Expected a function to decorate, got {type(func).__name__!r}; "
+            "pass decorator options as keyword arguments"
+        )
+    return decorator(func)
+
+
+def _format_arg_types(arg_names: Iterable[str], args: Iterable[Any]) -> str:
+    """
+    Format arguments as comma-separated 'name: type' pairs.
+    
+    Args:
+        arg_names: Parameter names (positional names, or keyword-argument keys)
+        args: Argument values matching the names
         
-        return result
-    return wrapper
+    Returns:
+        String such as 'x: int, y: str'
+    """
+    return ", ".join(f"{name}: {type(arg).__name__}" for name, arg in zip(arg_names, args))
 
 
-def _get_scope(func: Callable, args: tuple) -> str:
+def _get_scope(func: Callable) -> str:
     """
     Get scope name of the given function.
     
     Args:
         func: Function to inspect
-        args: Arguments passed to the function
         
     Returns:
         Fully qualified function name (module.Class.method or module.function)
     """
-    module = inspect.getmodule(func)
-    scope = module.__name__ if module else '<unknown>'
+    # __qualname__ already encodes enclosing classes and functions, so the
+    # scope is fixed at definition time and needs no per-call inspection
+    module = getattr(func, '__module__', None) or '<unknown>'
+    return f'{module}.{func.__qualname__}'
+
+
+def _sampling_profiler_class(backend: str) -> Optional[type]:
+    """
+    Resolve the profiler class to use for the given backend.
     
-    try:
-        # Check if this is a method by examining the first argument
-        if args and hasattr(args[0], '__class__'):
-            class_obj = args[0].__class__
-            # Verify the function actually belongs to this class
-            if hasattr(class_obj, func.__name__):
-                class_method = getattr(class_obj, func.__name__)
-                # Check if it's the same function (accounting for bound methods)
-                if (hasattr(class_method, '__func__') and 
-                    class_method.__func__ is func) or class_method is func:
-                    scope += f'.{class_obj.__name__}.{func.__name__}'
-                    return scope
+    Args:
+        backend: 'deterministic' or 'sampling'
         
-        scope += f'.{func.__name__}'
-    except (IndexError, AttributeError):
-        scope += f'.{func.__name__}'
-    
-    return scope
+    Returns:
+        pyinstrument's Profiler class for the 'sampling' backend, or None to use cProfile
+    """
+    if backend not in ('deterministic', 'sampling'):
+        raise ValueError(f"Unknown profiling backend: {backend!r}")
+    if backend == 'deterministic':
+        return None
+    try:
+        # Optional dependency, imported on first use so `import garnish` stays light
+        from pyinstrument import Profiler as SamplingProfiler
+    except ImportError:
+        logger.warning("pyinstrument is not installed; falling back to cProfile")
+        return None
+    return SamplingProfiler
 
 
 # Context manager for ad-hoc profiling
@@ -220,19 +322,23 @@ class Timer:
             # code to time
             pass
     """
+    __slots__ = ('description', 'precision', 'start_time', 'elapsed', '_fmt')
+
     def __init__(self, description: str = "Operation", precision: int = 3):
         self.description = description
         self.precision = precision
-        self.start_time: Optional[float] = None
+        self.start_time: Optional[int] = None
         self.elapsed: Optional[float] = None
+        # Bake the precision into the report format once
+        self._fmt = f"{{desc}} took {{t:.{precision}f}} seconds"
     
     def __enter__(self):
-        self.start_time = time.perf_counter()
+        self.start_time = perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.elapsed = time.perf_counter() - self.start_time
-        print(f'{self.description} took {self.elapsed:.{self.precision}f} seconds')
+        self.elapsed = (perf_counter_ns() - self.start_time) / 1e9
+        print(self._fmt.format(desc=self.description, t=self.elapsed))
         return False
 
 
@@ -244,26 +350,53 @@ class Profiler:
         with Profiler("My operation"):
             # code to profile
             pass
+        
+        with Profiler("My operation", mode="sampling", interval=0.0005):
+            # code to profile with pyinstrument
+            pass
     """
-    def __init__(self, description: str = "Operation", limit: int = 20):
+    __slots__ = ('description', 'limit', 'mode', 'interval', 'profiler', '_sampler', '_buffer')
+
+    def __init__(self,
+                 description: str = "Operation",
+                 limit: int = 20,
+                 mode: str = 'deterministic',
+                 interval: float = 0.001):
         self.description = description
         self.limit = limit
-        self.profiler: Optional[cProfile.Profile] = None
+        self.mode = mode
+        self.interval = interval
+        # cProfile.Profile or pyinstrument.Profiler (imported lazily), set in __enter__
+        self.profiler: Any = None
+        # Resolved here so an unknown mode fails when the profiler is built
+        self._sampler = _sampling_profiler_class(mode)
+        # Reused across enter/exit cycles to avoid a new buffer per exit
+        self._buffer = StringIO()
     
     def __enter__(self):
-        self.profiler = cProfile.Profile()
-        self.profiler.enable()
+        if self._sampler is not None:
+            self.profiler = self._sampler(interval=self.interval)
+            self.profiler.start()
+        else:
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.profiler.disable()
-        string_buffer = StringIO()
-        stats = pstats.Stats(self.profiler, stream=string_buffer)
-        stats.sort_stats('cumulative')
-        stats.print_stats(self.limit)
+        if self._sampler is None:
+            self.profiler.disable()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            (pstats.Stats(self.profiler, stream=self._buffer)
+                .sort_stats('cumulative')
+                .print_stats(self.limit))
+            output = self._buffer.getvalue()
+        else:
+            self.profiler.stop()
+            output = self.profiler.output_text(unicode=True, color=False)
         
         print(f'\nCPU Profile for {self.description}:')
-        print(string_buffer.getvalue())
+        print(output)
         return False
 
 
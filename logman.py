@@ -1,63 +1,164 @@
 import os
+import atexit
 import logging
 import platform
-import subprocess
+import queue
 import socket
+import threading
+import time
 from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
-from rich.logging import RichHandler
+from importlib import metadata
+from pathlib import Path
+from typing import List, Optional, Tuple
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from src.configs.config import Config
 
+# Resolved once at import instead of calling getcwd() for every new logger
+LOG_FOLDER = os.path.join(os.getcwd(), 'logs')
 
-def get_logger(name=__name__):
-    logger = logging.getLogger(name)
-    if not logger.handlers:  
-        logger.setLevel(Config.LOG_LEVEL)
 
+# Loggers only enqueue records; a single background listener writes them to disk
+_LOG_QUEUE: queue.Queue = queue.Queue(-1)
+_file_handler: Optional[RotatingFileHandler] = None
+_listener: Optional[QueueListener] = None
+_queue_handlers: List[Tuple[logging.Logger, QueueHandler]] = []
+# Set in forked children, which do not inherit the listener thread
+_write_directly = False
+_lock = threading.Lock()
+
+
+def _get_file_handler() -> RotatingFileHandler:
+    """Create the process-wide rotating log file handler on first use."""
+    global _file_handler
+    if _file_handler is None:
         # Ensure logs folder exists
-        log_folder = os.path.join(os.getcwd(), 'logs')
-        os.makedirs(log_folder, exist_ok=True)
-        log_filename = os.path.join(log_folder, f'{datetime.now().strftime("%Y%m%d_%H%M%S")}.txt')
+        os.makedirs(LOG_FOLDER, exist_ok=True)
+        log_filename = os.path.join(LOG_FOLDER, time.strftime('%Y%m%d_%H%M%S') + '.txt')
 
         # File handler with rotation
-        file_handler = RotatingFileHandler(log_filename, maxBytes=5 * 1024 * 1024, backupCount=5)
-        file_handler.setLevel(Config.LOG_LEVEL)
+        _file_handler = RotatingFileHandler(log_filename, maxBytes=5 * 1024 * 1024, backupCount=5)
+        _file_handler.setLevel(Config.LOG_LEVEL)
         file_formatter = logging.Formatter(
             '[%(asctime)s.%(msecs)03d] [%(levelname)s] [%(module)s] - %(funcName)s: %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        file_handler.setFormatter(file_formatter)
+        _file_handler.setFormatter(file_formatter)
+    return _file_handler
+
+
+def _start_listener() -> None:
+    """Start the background listener that owns the rotating log file handler."""
+    global _listener
+    if _listener is None:
+        _listener = QueueListener(_LOG_QUEUE, _get_file_handler(), respect_handler_level=True)
+        _listener.start()
+        # Flush any queued records before the interpreter exits
+        atexit.register(_listener.stop)
 
-        # Rich console handler
-        rich_handler = RichHandler(rich_tracebacks=True, markup=True)
-        rich_handler.setLevel(Config.LOG_LEVEL)
-        rich_handler.setFormatter(logging.Formatter("%(message)s"))
 
-        # Add handlers to logger
+def _write_directly_after_fork() -> None:
+    """
+    Switch a forked child to writing straight to the inherited log file.
+
+    Only the forking thread survives a fork, so nothing in the child would ever
+    drain its copy of the queue and its records would be silently dropped.
+    """
+    global _write_directly, _lock
+    _write_directly = True
+    _lock = threading.Lock()
+    if not _queue_handlers:
+        return
+    # Queued loggers exist only once _start_listener() has built the file handler,
+    # so this returns the inherited handler rather than opening a new file
+    file_handler = _get_file_handler()
+    for logger, handler in _queue_handlers:
+        logger.removeHandler(handler)
         logger.addHandler(file_handler)
-        # logger.addHandler(rich_handler)
+    _queue_handlers.clear()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_write_directly_after_fork)
+
+
+def get_logger(name=__name__):
+    logger = logging.getLogger(name)
+    if not logger.handlers:  
+        logger.setLevel(Config.LOG_LEVEL)
+        with _lock:
+            if _write_directly:
+                logger.addHandler(_get_file_handler())
+            else:
+                _start_listener()
+                handler = QueueHandler(_LOG_QUEUE)
+                logger.addHandler(handler)
+                _queue_handlers.append((logger, handler))
 
     return logger
 
 
-def collect_run_metadata(seed: int) -> dict:
-    """Gather host, git SHA and versions for run.json and first log line."""
+def _find_git_dir(start: Path) -> Optional[Path]:
+    """Locate the git directory of start or its nearest parent, following `gitdir:` files."""
+    for directory in (start, *start.parents):
+        dot_git = directory / '.git'
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            # Worktrees and submodules point at their git directory from a .git file
+            content = dot_git.read_text().strip()
+            if content.startswith('gitdir: '):
+                return (directory / content[8:]).resolve()
+    return None
+
+
+def _read_git_sha(start: Optional[Path] = None) -> str:
+    """Resolve the commit SHA of HEAD by reading the git metadata files directly."""
     try:
-        git_sha = subprocess.check_output(["git", "rev-parse", "HEAD"], text=True).strip()
+        git_dir = _find_git_dir((start or Path.cwd()).resolve())
+        if git_dir is None:
+            return "unknown"
+        head = (git_dir / 'HEAD').read_text().strip()
+        if not head.startswith('ref: '):
+            return head
+        ref = head[5:]
+
+        # Worktrees keep branch refs in the repository's common directory
+        search_dirs = [git_dir]
+        common_dir = git_dir / 'commondir'
+        if common_dir.is_file():
+            search_dirs.append((git_dir / common_dir.read_text().strip()).resolve())
+
+        for directory in search_dirs:
+            ref_file = directory / ref
+            if ref_file.is_file():
+                return ref_file.read_text().strip()
+            # Refs may have been packed by `git gc`
+            packed_refs = directory / 'packed-refs'
+            if packed_refs.is_file():
+                for line in packed_refs.read_text().splitlines():
+                    if line.endswith(f' {ref}'):
+                        return line.split(' ', 1)[0]
     except Exception:
-        git_sha = "unknown"
+        pass
+    return "unknown"
+
+
+def _package_version(name: str) -> str:
+    """Read an installed package's version from its metadata without importing it."""
     try:
-        import tensorflow as tf
-        tf_ver = tf.__version__
-    except Exception:
-        tf_ver = "not-imported"
-    import numpy as np
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "not-installed"
+
+
+def collect_run_metadata(seed: int) -> dict:
+    """Gather host, git SHA and versions for run.json and first log line."""
     return {
         "seed": seed,
-        "git_sha": git_sha,
+        "git_sha": _read_git_sha(),
         "host": socket.gethostname(),
         "python": platform.python_version(),
-        "tensorflow": tf_ver,
-        "numpy": np.__version__,
+        "tensorflow": _package_version("tensorflow"),
+        "numpy": _package_version("numpy"),
         "started_at": datetime.now(timezone.utc).isoformat()
-    }
\ No newline at end of file
+    }